@@ -1,17 +1,18 @@
 import pathlib
 from .glb import GlbError, parse_glb
-from .parser import GltfData, parse_gltf
+from .parser import GltfData, parse_gltf, map_file
 
 
 def parse_path(path: pathlib.Path) -> GltfData:
     '''
     parse glb or gltf
     '''
-    data = path.read_bytes()
+    data = map_file(path)
     try:
         # first, try glb
         json, bin = parse_glb(data)
         if json and bin:
+            # bin is a memoryview on the mmap, GltfData keeps it alive
             return parse_gltf(json, path=path, bin=bin)
     except GlbError:
         pass
@@ -1,51 +1,47 @@
+import mmap
 import struct
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 
 
-class GlbError(RuntimeError):
-    pass
-
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
 
-class BytesReader:
-    def __init__(self, data: bytes):
-        self.data = data
-        self.pos = 0
+# magic, version, length
+_GLB_HEADER = struct.Struct('<III')
+# chunk_length, chunk_type
+_CHUNK_HEADER = struct.Struct('<II')
 
-    def is_end(self) -> bool:
-        return self.pos >= len(self.data)
-
-    def read(self, size: int) -> bytes:
-        if (self.pos + size) > len(self.data):
-            raise IOError()
-        data = self.data[self.pos:self.pos+size]
-        self.pos += size
-        return data
 
-    def read_int(self) -> int:
-        data = self.read(4)
-        return struct.unpack('i', data)[0]
+class GlbError(RuntimeError):
+    pass
 
 
-def parse_glb(data: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+def parse_glb(data: Buffer) -> Tuple[Optional[memoryview], Optional[memoryview]]:
     '''
     https://www.khronos.org/registry/glTF/specs/2.0/glTF-2.0.html#glb-file-format-specification
     '''
-    r = BytesReader(data)
-    if r.read_int() != 0x46546C67:
+    # slicing a memoryview does not copy
+    data = memoryview(data)
+    if len(data) < _GLB_HEADER.size:
+        raise GlbError('too short')
+    magic, version, length = _GLB_HEADER.unpack_from(data, 0)
+    if magic != 0x46546C67:
         raise GlbError('invalid magic')
 
-    version = r.read_int()
     if version != 2:
         raise GlbError(f'unknown version: {version}')
 
-    length = r.read_int()
-
+    pos = _GLB_HEADER.size
     json_chunk = None
     bin_chunk = None
-    while r.pos < length:
-        chunk_length = r.read_int()
-        chunk_type = r.read_int()
-        chunk_data = r.read(chunk_length)
+    while pos < length:
+        if (pos + _CHUNK_HEADER.size) > len(data):
+            raise IOError()
+        chunk_length, chunk_type = _CHUNK_HEADER.unpack_from(data, pos)
+        pos += _CHUNK_HEADER.size
+        if (pos + chunk_length) > len(data):
+            raise IOError()
+        chunk_data = data[pos:pos+chunk_length]
+        pos += chunk_length
         match chunk_type:
             case 0x4E4F534A:
                 json_chunk = chunk_data
@@ -1,78 +1,199 @@
+import os
+import mmap
 import pathlib
-import ctypes
-import re
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, List, Dict, Tuple, Union
 from .types import *
+from .glb import Buffer
+try:
+    import orjson
+
+    def json_loads(data: Buffer):
+        # orjson reads a memoryview without copying
+        return orjson.loads(memoryview(data))
+except ImportError:
+    import json
 
-
-DATA_URI = re.compile(r'^data:([^;]*);base64,(.*)')
+    def json_loads(data: Buffer):
+        # json.loads does not accept memoryview or mmap
+        return json.loads(bytes(data))
+try:
+    # simd decoder. releases the GIL
+    from pybase64 import b64decode
+    DECODE_RELEASES_GIL = True
+except ImportError:
+    # binascii holds the GIL
+    from base64 import b64decode
+    DECODE_RELEASES_GIL = False
+
+
+BASE64_SEPARATOR = ';base64,'
+URLSAFE_TO_STANDARD = str.maketrans('-_', '+/')
+
+# primitive attribute => slot in GltfPrimitive order
+ATTRIBUTE_SLOT = {
+    'POSITION': 0,
+    'NORMAL': 1,
+    'TEXCOORD_0': 2,
+    'TEXCOORD_1': 3,
+    'TEXCOORD_2': 4,
+    'TANGENT': 5,
+    'COLOR_0': 6,
+    'JOINTS_0': 7,
+    'WEIGHTS_0': 8,
+}
+
+
+def split_data_uri(uri: str) -> Tuple[str, str]:
+    '''
+    data:{mime};base64,{payload} => (mime, payload)
+    '''
+    head, sep, payload = uri.partition(BASE64_SEPARATOR)
+    if not sep or not head.startswith('data:'):
+        raise GltfError(f'not base64 data uri: {uri[:32]}')
+    return head[5:], payload
+
+
+def map_file(path: Union[str, pathlib.Path]) -> Buffer:
+    '''
+    read only mmap. pages are loaded when touched
+    '''
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            # mmap can not map an empty file
+            return b''
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # the mapping keeps its own reference to the file
+        os.close(fd)
+
+
+def decode_base64(payload: str) -> bytes:
+    '''
+    standard or urlsafe alphabet
+    '''
+    if '-' in payload or '_' in payload:
+        payload = payload.translate(URLSAFE_TO_STANDARD)
+    return b64decode(payload)
 
 
 class GltfBufferReader:
-    def __init__(self, gltf, path: Optional[pathlib.Path], bin: Optional[bytes]):
+    def __init__(self, gltf, path: Optional[pathlib.Path], bin: Optional[Buffer]):
         self.gltf = gltf
         self.bin = bin
         self.path = path
-        self.uri_cache: Dict[str, bytes] = {}
+        # external uri is relative to the gltf file
+        self.base_dir = str(path.parent) if path else None
+        # uri => (mime, bytes). mime is None for files, use the file name
+        self.uri_cache: Dict[str, Tuple[Optional[str], bytes]] = {}
+        self.buffer_cache: Dict[int, memoryview] = {}
+        self.buffer_view_cache: Dict[int, memoryview] = {}
+        self.accessor_cache: Dict[int, GltfAccessorSlice] = {}
+
+    def _file_uri_path(self, uri: str) -> str:
+        if not self.base_dir:
+            raise NotImplementedError()
+        if '%' in uri:
+            import urllib.parse
+            uri = urllib.parse.unquote(uri)
+        return os.path.join(self.base_dir, uri)
+
+    def _read_file_uri(self, uri: str) -> bytes:
+        with open(self._file_uri_path(uri), 'rb') as f:
+            return f.read()
+
+    def uri_mime_and_bytes(self, uri: str) -> Tuple[Optional[str], bytes]:
+        '''
+        a data uri is split and decoded once, a file is read once
+        '''
+        mime_data = self.uri_cache.get(uri)
+        if mime_data is not None:
+            return mime_data
+
+        if uri.startswith('data:'):
+            mime, payload = split_data_uri(uri)
+            mime_data = (mime, decode_base64(payload))
+        else:
+            mime_data = (None, self._read_file_uri(uri))
+        self.uri_cache[uri] = mime_data
+        return mime_data
 
     def uri_bytes(self, uri: str) -> bytes:
-        data = self.uri_cache.get(uri)
-        if not data:
-            if uri.startswith('data:'):
-                m = DATA_URI.match(uri)
-                if not m:
-                    raise RuntimeError()
-                import base64
-                data = base64.urlsafe_b64decode(m[2])
-            elif self.path:
-                import urllib.parse
-                path = self.path.parent / urllib.parse.unquote(uri)
-                data = path.read_bytes()
-            else:
-                raise NotImplementedError()
-        self.uri_cache[uri] = data
-        return data
+        return self.uri_mime_and_bytes(uri)[1]
+
+    def _buffer_bytes(self, buffer_index: int) -> memoryview:
+        data = self.buffer_cache.get(buffer_index)
+        if data is not None:
+            return data
 
-    def _buffer_bytes(self, buffer_index: int) -> bytes:
         if self.bin and buffer_index == 0:
             # glb bin_chunk
-            return self.bin
-
-        gltf_buffer = self.gltf['buffers'][buffer_index]
-        uri = gltf_buffer['uri']
-        if not isinstance(uri, str):
-            raise GltfError()
+            data = self.bin
+        else:
+            gltf_buffer = self.gltf['buffers'][buffer_index]
+            uri = gltf_buffer['uri']
+            if not isinstance(uri, str):
+                raise GltfError()
+            if uri.startswith('data:'):
+                data = self.uri_bytes(uri)
+            else:
+                # external .bin. the views in buffer_cache keep the mmap alive
+                data = map_file(self._file_uri_path(uri))
+        # slices of a memoryview are not copied
+        data = memoryview(data).cast('B')
+        self.buffer_cache[buffer_index] = data
+        return data
 
-        return self.uri_bytes(uri)
+    def buffer_view_bytes(self, buffer_view_index: int) -> memoryview:
+        # interleaved attributes share a bufferView
+        data = self.buffer_view_cache.get(buffer_view_index)
+        if data is not None:
+            return data
 
-    def buffer_view_bytes(self, buffer_view_index: int) -> bytes:
         gltf_buffer_view = self.gltf['bufferViews'][buffer_view_index]
         bin = self._buffer_bytes(gltf_buffer_view['buffer'])
         offset = gltf_buffer_view.get('byteOffset', 0)
         length = gltf_buffer_view['byteLength']
-        return bin[offset:offset+length]
+        data = bin[offset:offset+length]
+        self.buffer_view_cache[buffer_view_index] = data
+        return data
 
-    def read_accessor(self, accessor_index: int) -> GltfAccessorSlice:
-        gltf_accessor = self.gltf['accessors'][accessor_index]
+    def read_accessor(self, accessor_index: int, gltf_accessor=None) -> GltfAccessorSlice:
+        '''
+        gltf_accessor: self.gltf['accessors'][accessor_index] if already fetched
+        '''
+        # primitives and animation samplers often share accessors
+        accessor = self.accessor_cache.get(accessor_index)
+        if accessor is not None:
+            return accessor
+
+        if gltf_accessor is None:
+            gltf_accessor = self.gltf['accessors'][accessor_index]
         offset = gltf_accessor.get('byteOffset', 0)
         count = gltf_accessor['count']
-        element_type, element_count = get_accessor_type(gltf_accessor)
-        scalar_format = element_type._type_  # type: ignore
-        length = ctypes.sizeof(element_type) * element_count*count
-        match gltf_accessor:
-            case {'bufferView': buffer_view_index}:
-                bin = self.buffer_view_bytes(buffer_view_index)
-                bin = bin[offset:offset+length]
-                return GltfAccessorSlice(memoryview(bin).cast(scalar_format), element_count)
-            case _:
-                # zero filled
-                return GltfAccessorSlice(memoryview(b'\0' * length).cast(scalar_format), element_count)
+        scalar_format, element_count, stride = ACCESSOR_FORMAT[(
+            gltf_accessor['componentType'], gltf_accessor['type'])]
+        length = stride * count
+        normalized = gltf_accessor.get('normalized', False)
+        buffer_view_index = gltf_accessor.get('bufferView')
+        if buffer_view_index is None:
+            # zero filled
+            bin = memoryview(b'\0' * length)
+        else:
+            # accessors sharing a bufferView are views on the same memory
+            bin = self.buffer_view_bytes(buffer_view_index)[offset:offset+length]
+        accessor = GltfAccessorSlice(
+            bin.cast(scalar_format), element_count, normalized)
+        self.accessor_cache[accessor_index] = accessor
+        return accessor
 
 
 class GltfData:
-    def __init__(self, gltf, path: Optional[pathlib.Path], bin: Optional[bytes]):
+    def __init__(self, gltf, path: Optional[pathlib.Path], bin: Optional[Buffer]):
         self.gltf = gltf
         self.path = path
+        # for glb, a view on the mapped file. accessors slice into it
         self.bin = bin
         self.buffer_reader = GltfBufferReader(gltf, path, bin)
         self.images: List[GltfImage] = []
@@ -95,13 +216,8 @@ class GltfData:
             case {'bufferView': buffer_view_index, 'mimeType': mime}:
                 return GltfImage(i, name or f'{i}', self.buffer_reader.buffer_view_bytes(buffer_view_index), MimeType(mime), extensions, extras)
             case {'uri': uri}:
-                if uri.startswith('data:'):
-                    m = DATA_URI.match(uri)
-                    if not m:
-                        raise RuntimeError()
-                    return GltfImage(i, uri, self.buffer_reader.uri_bytes(uri), MimeType(m[1]), extensions, extras)
-                else:
-                    return GltfImage(i, uri, self.buffer_reader.uri_bytes(uri), MimeType.from_name(uri), extensions, extras)
+                mime, data = self.buffer_reader.uri_mime_and_bytes(uri)
+                return GltfImage(i, uri, data, MimeType(mime) if mime else MimeType.from_name(uri), extensions, extras)
             case _:
                 raise GltfError()
 
@@ -122,131 +238,69 @@ class GltfData:
             case _:
                 raise Exception()
 
-    def _parse_material(self, i: int, gltf_material) -> GltfMaterial:
-        name = f'{i}'
-        base_color_texture = None
-        base_color_factor = RGBA(1, 1, 1, 1)
-        metallic_roughness_texture = None
-        metallic_factor = 0.0
-        roughness_factor = 0.0
-        emissive_texture = None
-        emissive_factor = RGB(0, 0, 0)
-        normal_texture = None
-        occlusion_texture = None
-        alpha_mode = AlphaMode.OPAQUE
-        alpha_cutoff = 0.5
-        double_sided = False
-        extensions = None
-        extras = None
-        for k, v in gltf_material.items():
-            match k:
-                case 'name':
-                    name = v
-                case 'pbrMetallicRoughness':
-                    for kk, vv in v.items():
-                        match kk:
-                            case 'baseColorTexture':
-                                match vv:
-                                    case {'index': texture_index}:
-                                        base_color_texture = self.textures[texture_index]
-                                    case _:
-                                        raise GltfError()
-                            case 'baseColorFactor':
-                                base_color_factor = RGBA(*vv)
-                            case 'metallicFactor':
-                                metallic_factor = vv
-                            case 'roughnessFactor':
-                                roughness_factor = vv
-                            case 'metallicRoughnessTexture':
-                                match vv:
-                                    case {'index': texture_index}:
-                                        metallic_roughness_texture = self.textures[texture_index]
-                            case _:
-                                raise NotImplementedError()
-                        pass
-                case 'emissiveTexture':
-                    match v:
-                        case {'index': texture_index}:
-                            emissive_texture = self.textures[texture_index]
-                case 'emissiveFactor':
-                    emissive_factor = RGB(*v)
-                case 'alphaMode':
-                    alpha_mode = AlphaMode(v)
-                case 'alphaCutoff':
-                    alpha_cutoff = v
-                case 'doubleSided':
-                    double_sided = v
-                case 'normalTexture':
-                    match v:
-                        case {'index': texture_index}:
-                            normal_texture = self.textures[texture_index]
-                        case _:
-                            raise GltfError()
-                case 'occlusionTexture':
-                    match v:
-                        case {'index': texture_index}:
-                            occlusion_texture = self.textures[texture_index]
-                        case _:
-                            raise GltfError()
-
-                case 'extensions':
-                    extensions = v
-                case 'extras':
-                    extras = v
+    def _get_texture(self, gltf_texture_info, strict: bool = True) -> Optional[GltfTexture]:
+        '''
+        strict: raise if index is missing. otherwise the texture is ignored
+        '''
+        match gltf_texture_info:
+            case None:
+                return None
+            case {'index': texture_index}:
+                return self.textures[texture_index]
+            case _ if not strict:
+                return None
+            case _:
+                raise GltfError()
 
-                case _:
-                    raise NotImplementedError()
-        material = GltfMaterial(i, name, base_color_texture,
-                                base_color_factor, metallic_roughness_texture, metallic_factor, roughness_factor,
-                                emissive_texture, emissive_factor, normal_texture, occlusion_texture, alpha_mode, alpha_cutoff, double_sided, extensions, extras)
+    def _parse_material(self, i: int, gltf_material) -> GltfMaterial:
+        pbr = gltf_material.get('pbrMetallicRoughness') or {}
+        base_color_factor = pbr.get('baseColorFactor')
+        emissive_factor = gltf_material.get('emissiveFactor')
+        material = GltfMaterial(i, gltf_material.get('name', f'{i}'),
+                                self._get_texture(pbr.get('baseColorTexture')),
+                                RGBA(*base_color_factor) if base_color_factor else RGBA(1, 1, 1, 1),
+                                self._get_texture(pbr.get('metallicRoughnessTexture'), strict=False),
+                                pbr.get('metallicFactor', 0.0),
+                                pbr.get('roughnessFactor', 0.0),
+                                self._get_texture(gltf_material.get('emissiveTexture'), strict=False),
+                                RGB(*emissive_factor) if emissive_factor else RGB(0, 0, 0),
+                                self._get_texture(gltf_material.get('normalTexture')),
+                                self._get_texture(gltf_material.get('occlusionTexture')),
+                                AlphaMode(gltf_material.get('alphaMode', 'OPAQUE')),
+                                gltf_material.get('alphaCutoff', 0.5),
+                                gltf_material.get('doubleSided', False),
+                                gltf_material.get('extensions'),
+                                gltf_material.get('extras'))
         return material
 
     def _parse_mesh(self, i: int, gltf_mesh) -> GltfMesh:
         primitives = []
+        gltf_accessors = self.gltf['accessors']
         for gltf_prim in gltf_mesh['primitives']:
             gltf_attributes = gltf_prim['attributes']
-            positions = None
-            position_min = Vec3(float('inf'), float('inf'), float('inf'))
-            position_max = Vec3(-float('inf'), -float('inf'), -float('inf'))
-            normal = None
-            uv0 = None
-            uv1 = None
-            uv2 = None
-            tangent = None
-            color = None
-            joints = None
-            weights = None
+            attributes: List[Optional[GltfAccessorSlice]] = [
+                None] * len(ATTRIBUTE_SLOT)
+            position_min = None
+            position_max = None
             for k, v in gltf_attributes.items():
-                match k:
-                    case 'POSITION':
-                        positions = self.buffer_reader.read_accessor(v)
-                        match self.gltf['accessors'][v]:
-                            case {
-                                'min': min_list,
-                                'max': max_list
-                            }:
-                                position_min = Vec3(*min_list)
-                                position_max = Vec3(*max_list)
-                    case 'NORMAL':
-                        normal = self.buffer_reader.read_accessor(v)
-                    case 'TEXCOORD_0':
-                        uv0 = self.buffer_reader.read_accessor(v)
-                    case 'TEXCOORD_1':
-                        uv1 = self.buffer_reader.read_accessor(v)
-                    case 'TEXCOORD_2':
-                        uv2 = self.buffer_reader.read_accessor(v)
-                    case 'TANGENT':
-                        tangent = self.buffer_reader.read_accessor(v)
-                    case 'COLOR_0':
-                        color = self.buffer_reader.read_accessor(v)
-                    case 'JOINTS_0':
-                        joints = self.buffer_reader.read_accessor(v)
-                    case 'WEIGHTS_0':
-                        weights = self.buffer_reader.read_accessor(v)
-                    case _:
-                        raise NotImplementedError()
+                slot = ATTRIBUTE_SLOT.get(k)
+                if slot is None:
+                    # TEXCOORD_3, COLOR_1, _CUSTOM... are not supported yet
+                    continue
+                gltf_accessor = gltf_accessors[v]
+                attributes[slot] = self.buffer_reader.read_accessor(
+                    v, gltf_accessor)
+                if slot == 0 and 'min' in gltf_accessor and 'max' in gltf_accessor:
+                    position_min = Vec3(*gltf_accessor['min'])
+                    position_max = Vec3(*gltf_accessor['max'])
+            positions, normal, uv0, uv1, uv2, tangent, color, joints, weights = attributes
             if not positions:
                 raise GltfError('no POSITIONS')
+            if not position_min or not position_max:
+                # min and max are required by spec, but not always present
+                min_list, max_list = positions.get_min_max()
+                position_min = Vec3(*min_list)
+                position_max = Vec3(*max_list)
 
             indices = None
             match gltf_prim:
@@ -271,49 +325,29 @@ class GltfData:
         return mesh
 
     def _parse_node(self, i: int, gltf_node) -> GltfNode:
-        node = GltfNode(i, f'{i}', [])
-        for k, v in gltf_node.items():
-            match k:
-                case 'name':
-                    node.name = v
-                case 'mesh':
-                    node.mesh = self.meshes[v]
-                case 'children':
-                    pass
-                case 'matrix':
-                    node.matrix = v
-                case 'translation':
-                    node.translation = Vec3(*v)
-                case 'rotation':
-                    node.rotation = Vec4(*v)
-                case 'scale':
-                    node.scale = Vec3(*v)
-                case 'skin':
-                    # TODO:
-                    pass
-                case 'camera':
-                    # TODO:
-                    pass
-                case 'extensions':
-                    node.extensions = v
-                case 'extras':
-                    node.extras = v
-                case _:
-                    raise NotImplementedError()
+        # children and skin are resolved after all nodes and skins
+        mesh_index = gltf_node.get('mesh')
+        matrix = gltf_node.get('matrix')
+        translation = gltf_node.get('translation')
+        rotation = gltf_node.get('rotation')
+        scale = gltf_node.get('scale')
+        node = GltfNode(i, gltf_node.get('name', f'{i}'),
+                        mesh=self.meshes[mesh_index] if mesh_index is not None else None,
+                        matrix=Mat4(*matrix) if matrix else None,
+                        translation=Vec3(*translation) if translation else Vec3(0, 0, 0),
+                        rotation=Vec4(*rotation) if rotation else Vec4(0, 0, 0, 1),
+                        scale=Vec3(*scale) if scale else Vec3(1, 1, 1),
+                        extensions=gltf_node.get('extensions'),
+                        extras=gltf_node.get('extras'))
         return node
 
     def _parse_skin(self, i: int, gltf_skin) -> GltfSkin:
-        matrices = None
-        match gltf_skin:
-            case {'inverseBindMatrices': accessor}:
-                matrices = self.buffer_reader.read_accessor(accessor)
-        skeleton = None
-        match gltf_skin:
-            case {'skeleton': skeleton_index}:
-                skeleton = self.nodes[skeleton_index]
-
+        accessor = gltf_skin.get('inverseBindMatrices')
+        skeleton_index = gltf_skin.get('skeleton')
         skin = GltfSkin(i, gltf_skin.get('name', f'{i}'),
-                        matrices, skeleton,
+                        self.buffer_reader.read_accessor(
+                            accessor) if accessor is not None else None,
+                        self.nodes[skeleton_index] if skeleton_index is not None else None,
                         [self.nodes[joint] for joint in gltf_skin['joints']],
                         gltf_skin.get('extensions'),
                         gltf_skin.get('extras'))
@@ -350,63 +384,73 @@ class GltfData:
         return animation
 
     def parse(self):
-        # image
-        for i, gltf_image in enumerate(self.gltf.get('images', [])):
-            image = self._parse_image(i, gltf_image)
-            self.images.append(image)
+        # image file reads release the GIL. base64 decodes only with pybase64
+        with ThreadPoolExecutor() as executor:
+            if DECODE_RELEASES_GIL:
+                # decode data uri buffers. errors are raised again when the buffer is used
+                # external buffers are mapped on use
+                futures = []
+                for gltf_buffer in self.gltf.get('buffers', []):
+                    uri = gltf_buffer.get('uri')
+                    if isinstance(uri, str) and uri.startswith('data:'):
+                        futures.append(executor.submit(
+                            self.buffer_reader.uri_bytes, uri))
+                wait(futures)
+
+            # image
+            gltf_images = self.gltf.get('images', [])
+            # resolve buffers of bufferView images before the threads use them,
+            # otherwise each thread would decode or map the same buffer again
+            gltf_buffer_views = self.gltf.get('bufferViews', [])
+            for buffer_index in {gltf_buffer_views[gltf_image['bufferView']]['buffer']
+                                 for gltf_image in gltf_images if 'bufferView' in gltf_image}:
+                self.buffer_reader._buffer_bytes(buffer_index)
+            self.images = list(executor.map(
+                self._parse_image, range(len(gltf_images)), gltf_images))
 
         # texture
-        for i, gltf_texture in enumerate(self.gltf.get('textures', [])):
-            texture = self._parse_texture(i, gltf_texture)
-            self.textures.append(texture)
-
-        # material
-        maetrials = self.gltf.get('materials')
-        if maetrials:
-            for i, gltf_material in enumerate(maetrials):
-                material = self._parse_material(i, gltf_material)
-                self.materials.append(material)
-        else:
-            NotImplementedError('no material')
+        self.textures = [self._parse_texture(i, gltf_texture)
+                         for i, gltf_texture in enumerate(self.gltf.get('textures', []))]
+
+        # material. primitives without material use GltfMaterial.default()
+        self.materials = [self._parse_material(i, gltf_material)
+                          for i, gltf_material in enumerate(self.gltf.get('materials', []))]
 
         # mesh
-        for i, gltf_mesh in enumerate(self.gltf.get('meshes', [])):
-            mesh = self._parse_mesh(i, gltf_mesh)
-            self.meshes.append(mesh)
+        self.meshes = [self._parse_mesh(i, gltf_mesh)
+                       for i, gltf_mesh in enumerate(self.gltf.get('meshes', []))]
 
         # node
-        for i, gltf_node in enumerate(self.gltf.get('nodes', [])):
-            node = self._parse_node(i, gltf_node)
-            self.nodes.append(node)
+        gltf_nodes = self.gltf.get('nodes', [])
+        self.nodes = [self._parse_node(i, gltf_node)
+                      for i, gltf_node in enumerate(gltf_nodes)]
 
         # skinning
-        for i, gltf_skin in enumerate(self.gltf.get('skins', [])):
-            skin = self._parse_skin(i, gltf_skin)
-            self.skins.append(skin)
+        self.skins = [self._parse_skin(i, gltf_skin)
+                      for i, gltf_skin in enumerate(self.gltf.get('skins', []))]
 
         # node 2 pass
-        for i, gltf_node in enumerate(self.gltf.get('nodes', [])):
-            match gltf_node.get('children'):
-                case [*children]:
-                    for child_index in children:
-                        self.nodes[i].children.append(self.nodes[child_index])
-            match gltf_node:
-                case {'skin': skin_index}:
-                    self.nodes[i].skin = self.skins[skin_index]
+        nodes = self.nodes
+        for node, gltf_node in zip(nodes, gltf_nodes):
+            children = gltf_node.get('children')
+            if children:
+                node.children = [nodes[child_index]
+                                 for child_index in children]
+            skin_index = gltf_node.get('skin')
+            if skin_index is not None:
+                node.skin = self.skins[skin_index]
 
         # scene
-        self.scene += [self.nodes[node_index]
-                       for node_index in self.gltf['scenes'][self.gltf.get('scene', 0)]['nodes']]
+        self.scene = [self.nodes[node_index]
+                      for node_index in self.gltf['scenes'][self.gltf.get('scene', 0)]['nodes']]
 
         # animation
-        for i, gltf_animation in enumerate(self.gltf.get('animations', [])):
-            animation = self._parse_animation(i, gltf_animation)
-            self.animations.append(animation)
+        self.animations = [self._parse_animation(i, gltf_animation)
+                           for i, gltf_animation in enumerate(self.gltf.get('animations', []))]
 
 
-def parse_gltf(json_chunk: bytes, *, path: Optional[pathlib.Path] = None, bin: Optional[bytes] = None) -> GltfData:
-    import json
-    gltf = json.loads(json_chunk)
+def parse_gltf(json_chunk: Buffer, *, path: Optional[pathlib.Path] = None, bin: Optional[Buffer] = None) -> GltfData:
+    gltf = json_loads(json_chunk)
     data = GltfData(gltf, path, bin)
     data.parse()
 
@@ -1,12 +1,10 @@
 '''
 https://github.com/KhronosGroup/glTF/blob/main/specification/2.0/
 '''
-from ctypes.wintypes import RGB
-from typing import NamedTuple, Optional, Tuple, List, Type
+from typing import NamedTuple, Optional, Tuple, List, Type, Union
 import ctypes
 from enum import Enum
-import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class GltfError(RuntimeError):
@@ -52,6 +50,8 @@ class GltfAccessorSlice(NamedTuple):
     # float3 の場合 3
     # ushort1 の場合 1
     element_count: int = 1
+    # accessor.normalized. integer values map to [0, 1] or [-1, 1]
+    normalized: bool = False
 
     def get_stride(self) -> int:
         return self.scalar_view.itemsize * self.element_count
@@ -64,16 +64,55 @@ class GltfAccessorSlice(NamedTuple):
         begin = i * self.element_count
         return self.scalar_view[begin:begin+self.element_count]
 
+    def as_ndarray(self):
+        '''
+        numpy view of shape (count, element_count). requires numpy.
+
+        zero copy, except normalized integers that are dequantized to float32.
+        https://registry.khronos.org/glTF/specs/2.0/glTF-2.0.html#animations
+        '''
+        import numpy
+        array = numpy.frombuffer(
+            self.scalar_view, dtype=self.scalar_view.format).reshape(-1, self.element_count)
+        if self.normalized and array.dtype.kind in 'iu':
+            # signed values use max(c / MAX, -1.0)
+            array = numpy.maximum(array.astype(numpy.float32) /
+                                  numpy.iinfo(array.dtype).max, -1.0)
+        return array
+
+    def get_min_max(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        '''
+        per component min and max. +inf and -inf if empty
+
+        raw values like accessor.min/max, normalized integers are not dequantized.
+        '''
+        if self.get_count() == 0:
+            return (float('inf'),) * self.element_count, (-float('inf'),) * self.element_count
+        try:
+            array = self._replace(normalized=False).as_ndarray()
+        except ImportError:
+            # strided views are still reduced in C
+            components = [self.scalar_view[i::self.element_count]
+                          for i in range(self.element_count)]
+            return tuple(min(c) for c in components), tuple(max(c) for c in components)
+        return tuple(array.min(axis=0).tolist()), tuple(array.max(axis=0).tolist())
+
 
 COMPONENT_TYPE_TO_ELEMENT_TYPE = {
-    5120: ctypes.c_char,
-    5121: ctypes.c_byte,
+    5120: ctypes.c_byte,
+    5121: ctypes.c_ubyte,
     5122: ctypes.c_short,
     5123: ctypes.c_ushort,
     5125: ctypes.c_uint,
     5126: ctypes.c_float,
 }
 
+# componentType => (memoryview format, itemsize)
+COMPONENT_TYPE_INFO = {
+    component_type: (element_type._type_, ctypes.sizeof(element_type))
+    for component_type, element_type in COMPONENT_TYPE_TO_ELEMENT_TYPE.items()
+}
+
 TYPE_TO_ELEMENT_COUNT = {
     'SCALAR': 1,
     'VEC2': 2,
@@ -85,8 +124,24 @@ TYPE_TO_ELEMENT_COUNT = {
 }
 
 
+# (componentType, type) => (element_type, element_count)
+ACCESSOR_TYPE = {
+    (component_type, type): (element_type, element_count)
+    for component_type, element_type in COMPONENT_TYPE_TO_ELEMENT_TYPE.items()
+    for type, element_count in TYPE_TO_ELEMENT_COUNT.items()
+}
+
+# (componentType, type) => (memoryview format, element_count, stride)
+# float3 is ('f', 3, 12)
+ACCESSOR_FORMAT = {
+    (component_type, type): (scalar_format, element_count, itemsize * element_count)
+    for component_type, (scalar_format, itemsize) in COMPONENT_TYPE_INFO.items()
+    for type, element_count in TYPE_TO_ELEMENT_COUNT.items()
+}
+
+
 def get_accessor_type(gltf_accessor) -> Tuple[Type[ctypes._SimpleCData], int]:
-    return COMPONENT_TYPE_TO_ELEMENT_TYPE[gltf_accessor['componentType']], TYPE_TO_ELEMENT_COUNT[gltf_accessor['type']]
+    return ACCESSOR_TYPE[(gltf_accessor['componentType'], gltf_accessor['type'])]
 
 
 class MimeType(Enum):
@@ -96,21 +151,26 @@ class MimeType(Enum):
 
     @staticmethod
     def from_name(name: str):
-        match pathlib.Path(name).suffix.lower():
-            case ".png":
-                return MimeType.Png
-            case ".jpg":
-                return MimeType.Jpg
-            case ".ktx2":
-                return MimeType.Ktx2
-            case _:
-                raise GltfError(f'unknown image: {name}')
+        dot = name.rfind('.')
+        mime = EXT_TO_MIME.get(name[dot:].lower()) if dot >= 0 else None
+        if not mime:
+            raise GltfError(f'unknown image: {name}')
+        return mime
+
+
+EXT_TO_MIME = {
+    '.png': MimeType.Png,
+    '.jpg': MimeType.Jpg,
+    '.jpeg': MimeType.Jpg,
+    '.ktx2': MimeType.Ktx2,
+}
 
 
 class GltfImage(NamedTuple):
     index: int
     name: str
-    data: bytes
+    # memoryview when stored in a bufferView
+    data: Union[bytes, memoryview]
     mime: MimeType
     extensions: Optional[dict]
     extras: Optional[dict]
@@ -190,11 +250,11 @@ class GltfMesh(NamedTuple):
     extras: Optional[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class GltfNode:
     index: int
     name: str
-    children: List['GltfNode']
+    children: List['GltfNode'] = field(default_factory=list)
     mesh: Optional[GltfMesh] = None
     matrix: Optional[Mat4] = None
     translation: Optional[Vec3] = Vec3(0, 0, 0)
@@ -1,7 +1,18 @@
 import unittest
 import ctypes
 import array
-from gltfio.types import GltfAccessorSlice
+import base64
+import gc
+import json
+import pathlib
+import tempfile
+import time
+import importlib.util
+from unittest import mock
+import gltfio
+import gltfio.parser
+from gltfio.types import GltfAccessorSlice, GltfError, MimeType
+from gltfio.parser import GltfBufferReader, split_data_uri, map_file, decode_base64
 
 
 class TestBuffer(unittest.TestCase):
@@ -38,3 +49,139 @@ class TestBuffer(unittest.TestCase):
         tb = GltfAccessorSlice(memoryview(value), 3)
         value_slice = tb.get_item(1)
         self.assertEqual(array.array('f', (4, 5, 6)), value_slice)
+
+    def test_buffer_view_cache(self):
+        gltf = {
+            'bufferViews': [{'buffer': 0, 'byteOffset': 4, 'byteLength': 8}],
+            'accessors': [
+                {'bufferView': 0, 'componentType': 5123,
+                    'type': 'SCALAR', 'count': 2},
+                {'bufferView': 0, 'byteOffset': 4, 'componentType': 5123,
+                    'type': 'SCALAR', 'count': 2},
+            ],
+        }
+        bin = bytes(range(12))
+        reader = GltfBufferReader(gltf, None, bin)
+        view = reader.buffer_view_bytes(0)
+        self.assertIs(view, reader.buffer_view_bytes(0))
+        self.assertEqual(bin[4:12], view)
+        # accessors are views on the cached bufferView
+        self.assertIs(view.obj, reader.read_accessor(0).scalar_view.obj)
+        self.assertEqual(bin[8:12], reader.read_accessor(1).scalar_view.tobytes())
+
+    def test_mime_from_name(self):
+        self.assertEqual(MimeType.Png, MimeType.from_name('a/b.PNG'))
+        self.assertEqual(MimeType.Jpg, MimeType.from_name('b.jpeg'))
+        with self.assertRaises(GltfError):
+            MimeType.from_name('png')
+
+    def test_split_data_uri(self):
+        self.assertEqual(('image/png', 'AAAA'),
+                         split_data_uri('data:image/png;base64,AAAA'))
+        with self.assertRaises(GltfError):
+            split_data_uri('data:image/png,AAAA')
+
+    def test_min_max(self):
+        value = array.array('f', (1, 5, 3, 4, 2, 6))
+        tb = GltfAccessorSlice(memoryview(value), 3)
+        self.assertEqual(((1, 2, 3), (4, 5, 6)), tb.get_min_max())
+
+        normalized = GltfAccessorSlice(
+            memoryview(array.array('h', (-32767, 0, 100, 32767))), 2, True)
+        self.assertEqual(((-32767, 0), (100, 32767)), normalized.get_min_max())
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy required')
+    def test_ndarray(self):
+        value = array.array('f', (1, 2, 3, 4, 5, 6))
+        tb = GltfAccessorSlice(memoryview(value), 3)
+        self.assertEqual((2, 3), tb.as_ndarray().shape)
+        self.assertEqual([4, 5, 6], tb.as_ndarray()[1].tolist())
+
+        normalized = GltfAccessorSlice(
+            memoryview(array.array('B', (0, 255))), 1, True)
+        self.assertEqual([[0], [1]], normalized.as_ndarray().tolist())
+
+    def test_external_files(self):
+        positions = array.array('f', (0, 0, 0, 1, 0, 0, 0, 2, 0))
+        gltf = {
+            'asset': {'version': '2.0'},
+            # percent encoded uri
+            'buffers': [{'uri': 'mesh%20data.bin', 'byteLength': 36}],
+            'bufferViews': [{'buffer': 0, 'byteLength': 36}],
+            # no min, max
+            'accessors': [{'bufferView': 0, 'componentType': 5126,
+                           'type': 'VEC3', 'count': 3}],
+            'images': [{'uri': 'image.png'}],
+            'meshes': [{'primitives': [{'attributes': {'POSITION': 0}}]}],
+            'nodes': [{'mesh': 0}],
+            'scenes': [{'nodes': [0]}],
+        }
+        with tempfile.TemporaryDirectory() as dir:
+            dir = pathlib.Path(dir)
+            (dir / 'mesh data.bin').write_bytes(positions.tobytes())
+            (dir / 'image.png').write_bytes(b'png')
+            (dir / 'empty.gltf').write_bytes(b'')
+            path = dir / 'model.gltf'
+            path.write_text(json.dumps(gltf))
+
+            # mmap can not map an empty file
+            self.assertEqual(b'', map_file(dir / 'empty.gltf'))
+            with self.assertRaises(ValueError):
+                gltfio.parse_path(dir / 'empty.gltf')
+
+            data = gltfio.parse_path(path)
+            self.assertEqual(b'png', data.images[0].data)
+            self.assertIsInstance(data.images[0].data, bytes)
+            prim = data.meshes[0].primitives[0]
+            del data
+            gc.collect()
+
+            # the mapped .bin is alive while the accessor is referenced
+            self.assertEqual(positions.tolist(), prim.position.scalar_view.tolist())
+            self.assertEqual((0, 0, 0), prim.position_min)
+            self.assertEqual((1, 2, 0), prim.position_max)
+            # unmap before the directory is removed, windows can not delete a mapped file
+            del prim
+            gc.collect()
+
+    def test_data_uri_decoded_once(self):
+        png = b'png'
+        gltf = {
+            'asset': {'version': '2.0'},
+            'buffers': [{'uri': 'data:application/octet-stream;base64,' + base64.b64encode(png).decode(), 'byteLength': 3}],
+            'bufferViews': [{'buffer': 0, 'byteLength': 3}],
+            'images': [{'bufferView': 0, 'mimeType': 'image/png'}] * 8,
+            'scenes': [{'nodes': []}],
+        }
+        decode_base64 = gltfio.parser.decode_base64
+
+        def slow_decode(payload):
+            # a large buffer. image threads would all miss uri_cache
+            time.sleep(0.05)
+            return decode_base64(payload)
+
+        for releases_gil in (False, True):
+            with mock.patch.object(gltfio.parser, 'DECODE_RELEASES_GIL', releases_gil), \
+                    mock.patch.object(gltfio.parser, 'decode_base64', side_effect=slow_decode) as decode:
+                data = gltfio.parser.parse_gltf(json.dumps(gltf).encode())
+                self.assertEqual(1, decode.call_count)
+                self.assertEqual([png] * 8, [image.data.tobytes() for image in data.images])
+
+    def test_decode_base64(self):
+        # b'\xfb\xff\xbf' is '-_-_' in the urlsafe alphabet
+        data = bytes((0xfb, 0xff, 0xbf)) + b'abc'
+        urlsafe = base64.urlsafe_b64encode(data).decode()
+        self.assertTrue('-' in urlsafe or '_' in urlsafe)
+        standard = base64.b64encode(b'abc').decode()
+        decoders = [base64.b64decode]
+        if importlib.util.find_spec('pybase64'):
+            import pybase64
+            decoders.append(pybase64.b64decode)
+        for b64decode in decoders:
+            with mock.patch.object(gltfio.parser, 'b64decode', b64decode):
+                self.assertEqual(base64.urlsafe_b64decode(urlsafe), decode_base64(urlsafe))
+                self.assertEqual(base64.urlsafe_b64decode(standard), decode_base64(standard))
+
+        reader = GltfBufferReader({}, None, None)
+        self.assertEqual(('image/png', data),
+                         reader.uri_mime_and_bytes('data:image/png;base64,' + urlsafe))